@@ -1,25 +1,39 @@
 import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 import numpy as np
+import pandas as pd
+
+
+RISK_THRESHOLDS = np.array([0.35, 0.6, 0.8])
+RISK_LEVELS = np.array(["Low", "Medium", "High", "Critical"])
+RISK_LEVEL_DTYPE = pd.CategoricalDtype(RISK_LEVELS, ordered=True)
+
+
+def risk_codes(scores: np.ndarray) -> np.ndarray:
+    """Map an array of severity scores to risk tier indices into RISK_LEVELS."""
+    return np.searchsorted(RISK_THRESHOLDS, scores, side="right")
+
+
+def calculate_risk_level_vec(scores: np.ndarray) -> np.ndarray:
+    """Classify an array of severity scores into risk levels."""
+    return RISK_LEVELS[risk_codes(scores)]
 
 
 def calculate_risk_level(score: float) -> str:
     """Classify a severity score into a risk level."""
-    if score < 0.35:
-        return "Low"
-    elif score < 0.6:
-        return "Medium"
-    elif score < 0.8:
-        return "High"
-    else:
-        return "Critical"
+    return str(calculate_risk_level_vec(np.array([score]))[0])
 
 
-CATEGORY_ANOMALY_THRESHOLDS = {
+CATEGORY_ANOMALY_THRESHOLDS = MappingProxyType({
     "mental_health": 0.80,
     "service_load": 0.85,
     "fraud": 0.75,
     "misinformation": 0.78,
-}
+})
+
+CATEGORIES = tuple(CATEGORY_ANOMALY_THRESHOLDS)
 
 
 def detect_anomaly(score: float, category: str) -> bool:
@@ -38,19 +52,33 @@ def compute_confidence(score: float, anomaly: bool) -> float:
     return round(min(max(base, 0.55), 0.95), 2)
 
 
+def score_signals(scores: np.ndarray, thresholds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Compute anomaly flags and confidence scores for arrays of severity scores and anomaly thresholds."""
+    anomaly = scores >= thresholds
+    anomaly |= scores >= 0.9
+    confidence = scores * 0.35
+    confidence += 0.55
+    confidence += anomaly * 0.05
+    np.clip(confidence, 0.55, 0.95, out=confidence)
+    np.round(confidence, 2, out=confidence)
+    return anomaly, confidence
+
+
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+PHONE_PATTERN = re.compile(r"(?:\+?\d{1,3}[-.\s]?)?\(?\d{2,4}\)?[-.\s]?\d{3,4}[-.\s]?\d{3,4}")
+
+
 def redact_sensitive(text: str) -> str:
     """Remove emails and phone-like patterns from text."""
-    text = re.sub(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", "[REDACTED_EMAIL]", text)
-    text = re.sub(r"(\+?\d{1,3}[-.\s]?)?\(?\d{2,4}\)?[-.\s]?\d{3,4}[-.\s]?\d{3,4}", "[REDACTED_PHONE]", text)
-    return text
+    return PHONE_PATTERN.sub("[REDACTED_PHONE]", EMAIL_PATTERN.sub("[REDACTED_EMAIL]", text))
 
 
-ENTERPRISE_IMPACT = {
+ENTERPRISE_IMPACT = MappingProxyType({
     "Low": "Minor",
     "Medium": "Moderate",
     "High": "Significant",
     "Critical": "Severe",
-}
+})
 
 
 def estimate_enterprise_impact(risk_level: str) -> str:
@@ -58,12 +86,12 @@ def estimate_enterprise_impact(risk_level: str) -> str:
     return ENTERPRISE_IMPACT.get(risk_level, "Unknown")
 
 
-OWNER_TEAM = {
+OWNER_TEAM = MappingProxyType({
     "mental_health": "Student Services",
     "service_load": "IT Ops",
     "fraud": "Security",
     "misinformation": "Comms",
-}
+})
 
 
 def get_owner_team(category: str) -> str:
@@ -82,69 +110,113 @@ def get_sla(risk_level: str) -> str:
     return "1 week"
 
 
+IMPACT_BY_RISK_CODE = np.array([estimate_enterprise_impact(level) for level in RISK_LEVELS])
+SLA_BY_RISK_CODE = np.array([get_sla(level) for level in RISK_LEVELS])
+
+
+CATEGORY_CONTEXT = MappingProxyType({
+    "mental_health": "psychological wellness and support service demand",
+    "service_load": "infrastructure capacity and service availability",
+    "fraud": "financial integrity and transaction security",
+    "misinformation": "information accuracy and content authenticity",
+})
+
+RISK_STATEMENTS = MappingProxyType({
+    "Low": "Within normal operating parameters. Routine monitoring applies.",
+    "Medium": "Elevated risk requiring monitoring.",
+    "High": "Escalation threshold exceeded. Material operational risk.",
+    "Critical": "Immediate action required. Potential systemic impact.",
+})
+
+ANOMALY_EXPLANATION = " Anomaly detected: behavior deviates significantly from baseline."
+
+EXPLANATION_TEMPLATE = (
+    "**Analysis:** This signal relates to {context}. "
+    "{statement} "
+    "Severity score: {severity:.2f}. "
+    "Signal context: \"{description}\".{anomaly_text}\n\n"
+    "*Recommendation is advisory and requires human review.*"
+)
+
+
+@lru_cache(maxsize=4096)
 def generate_ai_explanation(category: str, severity_score: float, anomaly: bool, description: str) -> str:
     """Generate a professional AI explanation for a risk signal."""
     risk_level = calculate_risk_level(severity_score)
-
-    category_context = {
-        "mental_health": "psychological wellness and support service demand",
-        "service_load": "infrastructure capacity and service availability",
-        "fraud": "financial integrity and transaction security",
-        "misinformation": "information accuracy and content authenticity",
-    }
-
-    risk_statements = {
-        "Low": "Within normal operating parameters. Routine monitoring applies.",
-        "Medium": "Elevated risk requiring monitoring.",
-        "High": "Escalation threshold exceeded. Material operational risk.",
-        "Critical": "Immediate action required. Potential systemic impact.",
-    }
-
-    context = category_context.get(category, "operational risk monitoring")
-    statement = risk_statements.get(risk_level, "Assessment pending.")
-    anomaly_text = " Anomaly detected: behavior deviates significantly from baseline." if anomaly else ""
-
-    explanation = (
-        f"**Analysis:** This signal relates to {context}. "
-        f"{statement} "
-        f"Severity score: {severity_score:.2f}. "
-        f"Signal context: \"{redact_sensitive(description)}\".{anomaly_text}\n\n"
-        f"*Recommendation is advisory and requires human review.*"
+    return EXPLANATION_TEMPLATE.format(
+        context=CATEGORY_CONTEXT.get(category, "operational risk monitoring"),
+        statement=RISK_STATEMENTS.get(risk_level, "Assessment pending."),
+        severity=severity_score,
+        description=redact_sensitive(description),
+        anomaly_text=ANOMALY_EXPLANATION if anomaly else "",
     )
-    return explanation
 
 
+INTERVENTIONS = MappingProxyType({
+    ("mental_health", "Critical"): "Activate crisis response protocol. Deploy additional counseling resources. Notify wellness leadership team. Initiate 24-hour monitoring cycle.",
+    ("mental_health", "High"): "Increase counseling availability. Send proactive outreach to at-risk groups. Schedule wellness check-ins within 48 hours.",
+    ("mental_health", "Medium"): "Monitor wellness indicators. Prepare resource scaling plan. Review support service capacity.",
+    ("mental_health", "Low"): "Continue routine monitoring. Log for trend analysis.",
+    ("service_load", "Critical"): "Initiate capacity expansion protocol. Activate disaster recovery standby. Alert infrastructure on-call team. Consider load shedding non-critical services.",
+    ("service_load", "High"): "Scale horizontal resources. Enable request queuing. Prepare failover activation.",
+    ("service_load", "Medium"): "Monitor resource utilization trends. Pre-stage additional capacity. Review auto-scaling thresholds.",
+    ("service_load", "Low"): "Log metrics for capacity planning. No immediate action required.",
+    ("fraud", "Critical"): "Freeze affected accounts immediately. Escalate to fraud investigation unit. Preserve forensic evidence chain. Notify compliance officer.",
+    ("fraud", "High"): "Flag transactions for manual review. Increase authentication requirements. Alert risk management team.",
+    ("fraud", "Medium"): "Apply enhanced monitoring rules. Queue for next-cycle investigation. Update detection thresholds.",
+    ("fraud", "Low"): "Log for pattern analysis. No immediate intervention required.",
+    ("misinformation", "Critical"): "Issue immediate correction through official channels. Escalate to communications team. Implement content takedown if on owned platforms.",
+    ("misinformation", "High"): "Prepare counter-narrative. Flag content for review. Alert communications stakeholders.",
+    ("misinformation", "Medium"): "Monitor spread velocity. Prepare fact-check response. Log for trend analysis.",
+    ("misinformation", "Low"): "Archive for reference. Continue baseline monitoring.",
+})
+
+DEFAULT_INTERVENTION = "Apply standard operating procedures for this risk category and level."
+ANOMALY_INTERVENTION = " **[ANOMALY DETECTED]** Escalate to senior analyst for pattern review and root cause investigation."
+
+INTERVENTION_TABLE = np.array(
+    [
+        [INTERVENTIONS.get((category, level), DEFAULT_INTERVENTION) for level in RISK_LEVELS]
+        for category in CATEGORIES + (None,)
+    ],
+    dtype=object,
+)
+
+
+@lru_cache(maxsize=64)
 def recommend_intervention(category: str, risk_level: str, anomaly: bool) -> str:
     """Return concrete enterprise intervention recommendations."""
-    interventions = {
-        ("mental_health", "Critical"): "Activate crisis response protocol. Deploy additional counseling resources. Notify wellness leadership team. Initiate 24-hour monitoring cycle.",
-        ("mental_health", "High"): "Increase counseling availability. Send proactive outreach to at-risk groups. Schedule wellness check-ins within 48 hours.",
-        ("mental_health", "Medium"): "Monitor wellness indicators. Prepare resource scaling plan. Review support service capacity.",
-        ("mental_health", "Low"): "Continue routine monitoring. Log for trend analysis.",
-        ("service_load", "Critical"): "Initiate capacity expansion protocol. Activate disaster recovery standby. Alert infrastructure on-call team. Consider load shedding non-critical services.",
-        ("service_load", "High"): "Scale horizontal resources. Enable request queuing. Prepare failover activation.",
-        ("service_load", "Medium"): "Monitor resource utilization trends. Pre-stage additional capacity. Review auto-scaling thresholds.",
-        ("service_load", "Low"): "Log metrics for capacity planning. No immediate action required.",
-        ("fraud", "Critical"): "Freeze affected accounts immediately. Escalate to fraud investigation unit. Preserve forensic evidence chain. Notify compliance officer.",
-        ("fraud", "High"): "Flag transactions for manual review. Increase authentication requirements. Alert risk management team.",
-        ("fraud", "Medium"): "Apply enhanced monitoring rules. Queue for next-cycle investigation. Update detection thresholds.",
-        ("fraud", "Low"): "Log for pattern analysis. No immediate intervention required.",
-        ("misinformation", "Critical"): "Issue immediate correction through official channels. Escalate to communications team. Implement content takedown if on owned platforms.",
-        ("misinformation", "High"): "Prepare counter-narrative. Flag content for review. Alert communications stakeholders.",
-        ("misinformation", "Medium"): "Monitor spread velocity. Prepare fact-check response. Log for trend analysis.",
-        ("misinformation", "Low"): "Archive for reference. Continue baseline monitoring.",
-    }
-
-    base = interventions.get((category, risk_level), "Apply standard operating procedures for this risk category and level.")
+    base = INTERVENTIONS.get((category, risk_level), DEFAULT_INTERVENTION)
     if anomaly:
-        base += " **[ANOMALY DETECTED]** Escalate to senior analyst for pattern review and root cause investigation."
+        base += ANOMALY_INTERVENTION
     return base
 
 
+def recommend_intervention_vec(category_codes: np.ndarray, tier_codes: np.ndarray, anomaly: np.ndarray) -> np.ndarray:
+    """Return intervention recommendations for arrays of category codes (-1 if unknown), risk codes, and anomaly flags."""
+    base = INTERVENTION_TABLE[category_codes, tier_codes]
+    return np.where(anomaly, base + ANOMALY_INTERVENTION, base)
+
+
+def _lookup_by_category(codes: np.ndarray, uniques, mapping: Mapping, default) -> np.ndarray:
+    """Gather mapping values for factorized category codes, using the default for unknown or missing categories."""
+    values = [mapping.get(category, default) for category in uniques]
+    values.append(default)
+    return np.asarray(values)[codes]
+
+
 def enrich_dataframe(df):
-    """Add risk_level, anomaly_flag, and confidence_score columns to a signals DataFrame."""
-    df = df.copy()
-    df["risk_level"] = df["severity_score"].apply(calculate_risk_level)
-    df["anomaly_flag"] = df.apply(lambda r: detect_anomaly(r["severity_score"], r["category"]), axis=1)
-    df["confidence_score"] = df.apply(lambda r: compute_confidence(r["severity_score"], r["anomaly_flag"]), axis=1)
-    return df
+    """Return a signals DataFrame with risk_level, anomaly_flag, confidence_score, impact, owner_team, and sla columns added."""
+    score = df["severity_score"].to_numpy(dtype=float)
+    codes, uniques = pd.factorize(df["category"])
+    threshold = _lookup_by_category(codes, uniques, CATEGORY_ANOMALY_THRESHOLDS, 0.80)
+    anomaly, confidence = score_signals(score, threshold)
+    tier_codes = risk_codes(score)
+    return df.assign(
+        risk_level=pd.Categorical.from_codes(tier_codes, dtype=RISK_LEVEL_DTYPE),
+        anomaly_flag=anomaly,
+        confidence_score=confidence,
+        impact=IMPACT_BY_RISK_CODE[tier_codes],
+        owner_team=_lookup_by_category(codes, uniques, OWNER_TEAM, "Operations"),
+        sla=SLA_BY_RISK_CODE[tier_codes],
+    )
@@ -1,18 +1,272 @@
+import io
 import streamlit as st
 import pandas as pd
 import numpy as np
-from src.data import load_sample_csv, generate_simulated_signals, validate_dataframe
+from src.data import generate_simulated_signals, validate_dataframe
 from datetime import datetime
 from src.logic import (
     enrich_dataframe,
     generate_ai_explanation,
     recommend_intervention,
-    estimate_enterprise_impact,
-    get_owner_team,
-    get_sla,
+    recommend_intervention_vec,
+    CATEGORIES,
+    RISK_LEVELS,
 )
 
 
+_DISPLAY_COLS = (
+    "timestamp",
+    "category",
+    "severity_score",
+    "risk_level",
+    "anomaly_flag",
+    "confidence_score",
+    "description",
+)
+_PREVIEW_COLS = ["timestamp", "category", "severity_score", "description"]
+_CRITICAL_COLS = ("timestamp", "category", "severity_score", "confidence_score", "description")
+_ANOMALY_COLS = ["timestamp", "category", "severity_score", "risk_level", "confidence_score", "description"]
+_CARD_FIELDS = (
+    "risk_level",
+    "severity_score",
+    "category",
+    "anomaly_flag",
+    "description",
+    "confidence_score",
+    "impact",
+)
+_ALERT_CARD_COLS = [
+    "cat_title", "severity_score", "risk_level", "confidence_score",
+    "anomaly_text", "impact", "owner_team", "sla", "description",
+]
+_RISK_LEVELS_DESC = RISK_LEVELS[::-1].tolist()
+
+_PAGE_SIZE = 50
+_SIM_ROWS = 30
+
+_RESPONSIBLE_AI_SECTIONS = (
+    (
+        "Privacy by Design",
+        (
+            "- No personal data is stored by default; all signals are processed statelessly\n"
+            "- Sensitive information (emails, phone numbers) is automatically redacted before display\n"
+            "- Data retention policies are configurable per deployment and default to zero-retention\n"
+            "- All data processing follows the principle of minimal necessary access"
+        ),
+    ),
+    (
+        "Human-in-the-Loop Policy",
+        (
+            "- AI generates recommendations — **humans make all final decisions**\n"
+            "- Every AI output includes a mandatory advisory disclaimer\n"
+            "- Critical-severity decisions require explicit human approval before action\n"
+            "- Escalation paths ensure no automated action is taken without oversight"
+        ),
+    ),
+    (
+        "Bias & Fairness Considerations",
+        (
+            "- Risk models are regularly audited for demographic and category-level bias\n"
+            "- Protected group attributes are never used as direct model inputs\n"
+            "- Drift detection monitors are deployed to flag shifts in model behavior\n"
+            "- Fairness metrics (equalized odds, demographic parity) are tracked per release cycle"
+        ),
+    ),
+    (
+        "Audit Logging Plan",
+        (
+            "- Every risk classification decision is logged with timestamp, inputs, and outputs\n"
+            "- Human override actions are recorded with rationale for compliance review\n"
+            "- Model version and configuration are captured per inference call\n"
+            "- Logs are immutable and stored in tamper-evident audit storage"
+        ),
+    ),
+)
+_FAILURE_MODES_MD = (
+    "- **False positives:** Confidence scores and human review gates reduce unnecessary escalation\n"
+    "- **Hallucinations:** Rule-based logic (not generative AI) eliminates confabulation risk in core analysis\n"
+    "- **Over-reliance:** Mandatory advisory disclaimers and training materials reinforce critical thinking\n"
+    "- **Data quality issues:** Input validation catches missing or malformed data before analysis\n"
+    "- **Model degradation:** Scheduled revalidation cycles and drift detection ensure ongoing accuracy"
+)
+
+_ARCH_DIAGRAM = """
+┌─────────────────────────────────────────────────────────────┐
+│                      LOAD BALANCER                          │
+│                    (TLS Termination)                         │
+└──────────────────────┬──────────────────────────────────────┘
+                       │
+         ┌─────────────┼─────────────┐
+         ▼             ▼             ▼
+┌──────────────┐ ┌──────────────┐ ┌──────────────┐
+│  API Gateway │ │  API Gateway │ │  API Gateway │
+│  (Stateless) │ │  (Stateless) │ │  (Stateless) │
+│  Rate Limit  │ │  Rate Limit  │ │  Rate Limit  │
+└──────┬───────┘ └──────┬───────┘ └──────┬───────┘
+       │                │                │
+       └────────────────┼────────────────┘
+                        ▼
+         ┌──────────────────────────┐
+         │    INFERENCE SERVICE     │
+         │  (Horizontally Scaled)   │
+         │  Risk Classification     │
+         │  Anomaly Detection       │
+         │  Confidence Scoring      │
+         └────────────┬─────────────┘
+                      │
+         ┌────────────┼────────────┐
+         ▼            ▼            ▼
+┌──────────────┐ ┌──────────┐ ┌──────────────┐
+│  Encrypted   │ │  Audit   │ │  Monitoring  │
+│  Data Store  │ │   Log    │ │  & Alerting  │
+│  (AES-256)   │ │ (Immut.) │ │  (Prometheus)│
+└──────────────┘ └──────────┘ └──────────────┘
+"""
+
+_SCENARIOS = {
+    "university_exam_stress": {
+        "label": "Load University Exam Stress Scenario",
+        "sdg": "**SDG Alignment:** SDG 3 (Good Health & Well-being), SDG 4 (Quality Education) — "
+               "Aegis AI helps institutions detect early signs of student mental health crises during "
+               "high-pressure academic periods, enabling timely intervention and support.",
+        "pitch": (
+            "Imagine it's finals week at a major university. Counseling centers are overwhelmed, "
+            "online exam platforms are buckling, and rumors about schedule changes are spreading. "
+            "Aegis AI monitors these signals in real time — flagging critical stress indicators, "
+            "predicting service bottlenecks, and filtering misinformation. With Aegis AI, administrators "
+            "can act before a crisis escalates, not after. Every recommendation comes with full transparency "
+            "and a human-in-the-loop safeguard."
+        ),
+    },
+    "healthcare_capacity": {
+        "label": "Load Healthcare Capacity Scenario",
+        "sdg": "**SDG Alignment:** SDG 3 (Good Health & Well-being) — "
+               "Aegis AI supports healthcare systems in managing capacity surges, protecting "
+               "frontline worker wellness, and maintaining care quality under pressure.",
+        "pitch": (
+            "A regional hospital network is facing a surge in emergency admissions. ICU beds are running low, "
+            "staff burnout is spiking, and fraudulent billing claims are mixed into the chaos. "
+            "Aegis AI provides a unified risk dashboard — surfacing the most critical capacity signals, "
+            "flagging anomalies in real time, and recommending concrete interventions. The system never acts "
+            "alone: every alert includes a confidence score and requires human approval. This is AI that "
+            "supports healthcare professionals, not replaces them."
+        ),
+    },
+    "financial_fraud": {
+        "label": "Load Financial Fraud Scenario",
+        "sdg": "**SDG Alignment:** SDG 16 (Peace, Justice & Strong Institutions) — "
+               "Aegis AI strengthens financial integrity by detecting fraud patterns, protecting "
+               "consumers, and supporting regulatory compliance.",
+        "pitch": (
+            "A financial institution is seeing unusual patterns: synthetic identities in new accounts, "
+            "micro-transaction probing, and phishing campaigns targeting customers. Traditional rule-based "
+            "systems are overwhelmed by the volume. Aegis AI uses multi-signal analysis to detect, classify, "
+            "and prioritize fraud risks — from critical account freezes to routine monitoring. Every decision "
+            "is auditable, every recommendation transparent. This is responsible AI for the enterprise."
+        ),
+    },
+}
+
+_TIERS_DF = pd.DataFrame({
+    "Tier": ["Starter", "Professional", "Enterprise"],
+    "Signals/Month": ["10,000", "100,000", "Unlimited"],
+    "Users": ["5", "25", "Unlimited"],
+    "SLA": ["99.5%", "99.9%", "99.99%"],
+    "Support": ["Email", "Priority", "Dedicated CSM"],
+    "Features": [
+        "Core risk analysis, basic reporting",
+        "Full analysis suite, API access, custom rules",
+        "Custom models, on-prem option, audit compliance pack",
+    ],
+})
+
+_TREND_SERIES = ["Mental Health", "Service Load", "Fraud", "Misinformation"]
+_TREND_SCALES = np.array([0.5, 0.4, 0.6, 0.3])
+_TREND_OFFSETS = np.array([20, 15, 10, 8])
+_TREND_LO = np.array([5, 3, 2, 1])
+_TREND_HI = np.array([40, 35, 30, 25])
+
+_EXEC_SUMMARY_CRITICAL_TMPL = (
+    "**Executive Summary:** Escalation thresholds were breached across {domains} domains. "
+    "{critical} critical and {high} high-severity signals require leadership attention. "
+    "{anomalies} anomalous patterns identified. "
+    "Coordinated intervention within 60 minutes is recommended."
+)
+_EXEC_SUMMARY_ELEVATED_TMPL = (
+    "**Executive Summary:** Elevated risk activity detected across {domains} domains. "
+    "{high} high-severity signals and {anomalies} anomalies warrant close monitoring. "
+    "Recommend proactive resource allocation and stakeholder notification."
+)
+_PRIMARY_CATEGORIES_TMPL = "**Primary Categories:** {categories}"
+
+_LEVEL_ALERTS = {
+    "Critical": st.error,
+    "High": st.warning,
+    "Medium": st.info,
+    "Low": st.success,
+}
+
+_MODEL_TRANSPARENCY_MD = (
+    "- **Inputs evaluated:** category, severity_score, description\n"
+    "- **Risk tiering:** Deterministic thresholds (Low < 0.35, Medium < 0.6, High < 0.8, Critical >= 0.8)\n"
+    "- **Anomaly detection:** Category-specific thresholds and score >= 0.9\n"
+    "- **Confidence:** Heuristic calibration based on severity and anomaly\n"
+    "- **Human-in-the-loop:** Required for final decision"
+)
+
+_UPLOAD_DTYPES = {
+    "severity_score": "float64",
+    "category": "string[pyarrow]",
+    "description": "string[pyarrow]",
+}
+
+
+@st.cache_data(show_spinner=False)
+def _read_csv(raw: bytes) -> pd.DataFrame:
+    """Parse uploaded CSV bytes into an Arrow-backed DataFrame."""
+    return pd.read_csv(io.BytesIO(raw), engine="pyarrow", dtype_backend="pyarrow", dtype=_UPLOAD_DTYPES)
+
+
+@st.cache_data(ttl=None, show_spinner=False)
+def _build_trend_df() -> pd.DataFrame:
+    """Build the seeded 30-day risk signal trend shown on the Overview page."""
+    rng = np.random.default_rng(7)
+    days = 30
+    raw = rng.standard_normal((days, len(_TREND_SERIES))) * _TREND_SCALES
+    walk = np.clip(raw.cumsum(axis=0) + _TREND_OFFSETS, _TREND_LO, _TREND_HI)
+    return pd.DataFrame(walk, columns=_TREND_SERIES)
+
+
+@st.cache_data(show_spinner=False)
+def _enrich_and_sort(df: pd.DataFrame) -> pd.DataFrame:
+    """Enrich a signals DataFrame, downcast derived columns for display, and sort it by descending severity."""
+    enriched = enrich_dataframe(df).astype({
+        "confidence_score": "float32",
+        "category": "category",
+        "impact": "category",
+        "owner_team": "category",
+        "sla": "category",
+    })
+    order = np.argsort(-enriched["severity_score"].to_numpy(), kind="stable")
+    enriched = enriched.iloc[order].reset_index(drop=True)
+    return enriched
+
+
+@st.cache_data(show_spinner=False)
+def _load_scenario(scenario_key: str) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Return the enriched demo dataset with its top alerts and anomaly rows."""
+    enriched = _enrich_and_sort(generate_simulated_signals(_SIM_ROWS, scenario_key))
+    anomalies = enriched.loc[enriched["anomaly_flag"].to_numpy(dtype=bool), _ANOMALY_COLS]
+    return enriched, enriched.head(3), anomalies
+
+
+@st.cache_data(show_spinner=False)
+def _scenario_csv(scenario_key: str) -> bytes:
+    """Return the enriched dataset for a demo scenario as CSV bytes."""
+    enriched, _, _ = _load_scenario(scenario_key)
+    return enriched.to_csv(index=False).encode()
+
+
 def render_overview():
     """Render the Overview page with KPIs, trend chart, and context."""
     st.title("Aegis AI")
@@ -28,15 +282,7 @@ def render_overview():
     st.divider()
     st.subheader("Risk Signal Trend (Last 30 Days)")
 
-    np.random.seed(7)
-    days = 30
-    trend_data = pd.DataFrame({
-        "Mental Health": np.clip(np.cumsum(np.random.randn(days) * 0.5) + 20, 5, 40),
-        "Service Load": np.clip(np.cumsum(np.random.randn(days) * 0.4) + 15, 3, 35),
-        "Fraud": np.clip(np.cumsum(np.random.randn(days) * 0.6) + 10, 2, 30),
-        "Misinformation": np.clip(np.cumsum(np.random.randn(days) * 0.3) + 8, 1, 25),
-    })
-    st.line_chart(trend_data)
+    st.line_chart(_build_trend_df())
 
     st.divider()
     st.subheader("Why This Matters")
@@ -62,7 +308,7 @@ def render_risk_analysis():
         uploaded = st.file_uploader("Option A: Upload CSV", type=["csv"])
         if uploaded is not None:
             try:
-                df = pd.read_csv(uploaded)
+                df = _read_csv(uploaded.getvalue())
                 valid, msg = validate_dataframe(df)
                 if not valid:
                     st.error(f"Validation failed: {msg}")
@@ -76,7 +322,7 @@ def render_risk_analysis():
     with col_b:
         st.markdown("**Option B: Use Simulated Data**")
         if st.button("Load Simulated Dataset", key="sim_btn"):
-            st.session_state["risk_df"] = generate_simulated_signals(30, "general")
+            st.session_state["risk_df"] = generate_simulated_signals(_SIM_ROWS, "general")
 
     if df is not None:
         st.session_state["risk_df"] = df
@@ -84,67 +330,57 @@ def render_risk_analysis():
     if "risk_df" in st.session_state and st.session_state["risk_df"] is not None:
         df = st.session_state["risk_df"]
         st.subheader("Data Preview")
-        st.dataframe(df.head(10), use_container_width=True)
+        st.dataframe(df.loc[:, _PREVIEW_COLS].head(10).reset_index(drop=True), use_container_width=True)
 
-        enriched = enrich_dataframe(df)
-        enriched = enriched.sort_values("severity_score", ascending=False).reset_index(drop=True)
+        enriched = _enrich_and_sort(df)
         st.divider()
 
-        critical_alerts = enriched[enriched["risk_level"] == "Critical"]
+        critical_mask = enriched["risk_level"].cat.codes.to_numpy() == len(RISK_LEVELS) - 1
+        critical_alerts = enriched.iloc[critical_mask]
         if len(critical_alerts) > 0:
             st.subheader(f"Critical Alerts ({len(critical_alerts)})")
-            crit_cols = ["timestamp", "category", "severity_score", "confidence_score", "description"]
-            crit_available = [c for c in crit_cols if c in critical_alerts.columns]
-            st.dataframe(critical_alerts[crit_available], use_container_width=True)
+            st.dataframe(critical_alerts[list(_CRITICAL_COLS)], use_container_width=True)
             st.divider()
 
         st.subheader("Enriched Risk Analysis")
-        display_cols = ["timestamp", "category", "severity_score", "risk_level", "anomaly_flag", "confidence_score", "description"]
-        available_cols = [c for c in display_cols if c in enriched.columns]
-        st.dataframe(enriched[available_cols], use_container_width=True)
+        st.dataframe(enriched[list(_DISPLAY_COLS)], use_container_width=True)
 
         st.divider()
         st.subheader("Decision Card Generator")
-        max_idx = len(enriched) - 1
-        selected_idx = st.number_input(
-            "Select row index to inspect",
-            min_value=0,
-            max_value=max_idx,
-            value=0,
-            step=1,
-        )
+        with st.form("decision_form"):
+            selected_idx = st.number_input(
+                "Select row index to inspect",
+                min_value=0,
+                max_value=enriched.shape[0] - 1,
+                value=0,
+                step=1,
+            )
+            submitted = st.form_submit_button("Generate Decision Card")
 
-        if st.button("Generate Decision Card", key="decision_card_btn"):
-            row = enriched.iloc[selected_idx]
-            _render_decision_card(row)
+        if submitted:
+            pos = enriched.columns.get_indexer(_CARD_FIELDS)
+            rec = {c: enriched.iat[selected_idx, p] for c, p in zip(_CARD_FIELDS, pos)}
+            _render_decision_card(rec, selected_idx)
 
 
-def _render_decision_card(row):
-    """Render a Decision Card for a single risk signal row."""
-    risk_level = row["risk_level"]
-    severity = row["severity_score"]
-    category = row["category"]
-    anomaly = row["anomaly_flag"]
-    description = row["description"]
-    confidence = row["confidence_score"]
-    impact = estimate_enterprise_impact(risk_level)
+def _render_decision_card(rec: dict, row_name: int):
+    """Render a Decision Card for a single risk signal record."""
+    risk_level = rec["risk_level"]
+    severity = float(rec["severity_score"])
+    category = rec["category"]
+    anomaly = bool(rec["anomaly_flag"])
+    description = rec["description"]
+    confidence = rec["confidence_score"]
+    impact = rec["impact"]
 
     explanation = generate_ai_explanation(category, severity, anomaly, description)
     intervention = recommend_intervention(category, risk_level, anomaly)
 
-    level_colors = {
-        "Critical": "error",
-        "High": "warning",
-        "Medium": "info",
-        "Low": "success",
-    }
-    alert_type = level_colors.get(risk_level, "info")
-
     with st.container():
         st.markdown("---")
-        st.markdown(f"### Decision Card — Row {row.name}")
+        st.markdown(f"### Decision Card — Row {row_name}")
 
-        getattr(st, alert_type)(f"**Risk Level: {risk_level}**")
+        _LEVEL_ALERTS.get(risk_level, st.info)(f"**Risk Level: {risk_level}**")
 
         col1, col2 = st.columns(2)
         with col1:
@@ -160,16 +396,10 @@ def _render_decision_card(row):
 
         st.metric("Confidence Score", f"{confidence:.2f}")
 
-        st.caption(f"Audit Log: Event recorded at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        st.caption(f"Audit Log: Event recorded at {datetime.now().isoformat(sep=' ', timespec='seconds')}")
 
         with st.expander("Model Transparency"):
-            st.markdown(
-                "- **Inputs evaluated:** category, severity_score, description\n"
-                "- **Risk tiering:** Deterministic thresholds (Low < 0.35, Medium < 0.6, High < 0.8, Critical >= 0.8)\n"
-                "- **Anomaly detection:** Category-specific thresholds and score >= 0.9\n"
-                "- **Confidence:** Heuristic calibration based on severity and anomaly\n"
-                "- **Human-in-the-loop:** Required for final decision"
-            )
+            st.markdown(_MODEL_TRANSPARENCY_MD)
 
 
 def render_responsible_ai():
@@ -178,49 +408,15 @@ def render_responsible_ai():
     st.markdown("Aegis AI is built on principles of transparency, fairness, and accountability.")
     st.divider()
 
-    st.subheader("Privacy by Design")
-    st.markdown(
-        "- No personal data is stored by default; all signals are processed statelessly\n"
-        "- Sensitive information (emails, phone numbers) is automatically redacted before display\n"
-        "- Data retention policies are configurable per deployment and default to zero-retention\n"
-        "- All data processing follows the principle of minimal necessary access"
-    )
-
-    st.subheader("Human-in-the-Loop Policy")
-    st.markdown(
-        "- AI generates recommendations — **humans make all final decisions**\n"
-        "- Every AI output includes a mandatory advisory disclaimer\n"
-        "- Critical-severity decisions require explicit human approval before action\n"
-        "- Escalation paths ensure no automated action is taken without oversight"
-    )
-
-    st.subheader("Bias & Fairness Considerations")
-    st.markdown(
-        "- Risk models are regularly audited for demographic and category-level bias\n"
-        "- Protected group attributes are never used as direct model inputs\n"
-        "- Drift detection monitors are deployed to flag shifts in model behavior\n"
-        "- Fairness metrics (equalized odds, demographic parity) are tracked per release cycle"
-    )
-
-    st.subheader("Audit Logging Plan")
-    st.markdown(
-        "- Every risk classification decision is logged with timestamp, inputs, and outputs\n"
-        "- Human override actions are recorded with rationale for compliance review\n"
-        "- Model version and configuration are captured per inference call\n"
-        "- Logs are immutable and stored in tamper-evident audit storage"
-    )
+    for title, body in _RESPONSIBLE_AI_SECTIONS:
+        st.subheader(title)
+        st.markdown(body)
 
     st.subheader("Failure Modes & Mitigations")
     st.warning(
         "**Known failure modes and how Aegis AI addresses them:**"
     )
-    st.markdown(
-        "- **False positives:** Confidence scores and human review gates reduce unnecessary escalation\n"
-        "- **Hallucinations:** Rule-based logic (not generative AI) eliminates confabulation risk in core analysis\n"
-        "- **Over-reliance:** Mandatory advisory disclaimers and training materials reinforce critical thinking\n"
-        "- **Data quality issues:** Input validation catches missing or malformed data before analysis\n"
-        "- **Model degradation:** Scheduled revalidation cycles and drift detection ensure ongoing accuracy"
-    )
+    st.markdown(_FAILURE_MODES_MD)
 
 
 def render_enterprise_architecture():
@@ -230,41 +426,7 @@ def render_enterprise_architecture():
     st.divider()
 
     st.subheader("System Architecture")
-    st.code(
-        """
-┌─────────────────────────────────────────────────────────────┐
-│                      LOAD BALANCER                          │
-│                    (TLS Termination)                         │
-└──────────────────────┬──────────────────────────────────────┘
-                       │
-         ┌─────────────┼─────────────┐
-         ▼             ▼             ▼
-┌──────────────┐ ┌──────────────┐ ┌──────────────┐
-│  API Gateway │ │  API Gateway │ │  API Gateway │
-│  (Stateless) │ │  (Stateless) │ │  (Stateless) │
-│  Rate Limit  │ │  Rate Limit  │ │  Rate Limit  │
-└──────┬───────┘ └──────┬───────┘ └──────┬───────┘
-       │                │                │
-       └────────────────┼────────────────┘
-                        ▼
-         ┌──────────────────────────┐
-         │    INFERENCE SERVICE     │
-         │  (Horizontally Scaled)   │
-         │  Risk Classification     │
-         │  Anomaly Detection       │
-         │  Confidence Scoring      │
-         └────────────┬─────────────┘
-                      │
-         ┌────────────┼────────────┐
-         ▼            ▼            ▼
-┌──────────────┐ ┌──────────┐ ┌──────────────┐
-│  Encrypted   │ │  Audit   │ │  Monitoring  │
-│  Data Store  │ │   Log    │ │  & Alerting  │
-│  (AES-256)   │ │ (Immut.) │ │  (Prometheus)│
-└──────────────┘ └──────────┘ └──────────────┘
-        """,
-        language=None,
-    )
+    st.code(_ARCH_DIAGRAM, language=None)
 
     st.divider()
 
@@ -304,20 +466,7 @@ def render_enterprise_architecture():
     st.divider()
     st.subheader("Business Model")
     st.markdown("Aegis AI follows a tiered SaaS model designed for enterprise adoption:")
-
-    tiers = pd.DataFrame({
-        "Tier": ["Starter", "Professional", "Enterprise"],
-        "Signals/Month": ["10,000", "100,000", "Unlimited"],
-        "Users": ["5", "25", "Unlimited"],
-        "SLA": ["99.5%", "99.9%", "99.99%"],
-        "Support": ["Email", "Priority", "Dedicated CSM"],
-        "Features": [
-            "Core risk analysis, basic reporting",
-            "Full analysis suite, API access, custom rules",
-            "Custom models, on-prem option, audit compliance pack",
-        ],
-    })
-    st.table(tiers)
+    st.table(_TIERS_DF)
 
 
 def render_demo_mode():
@@ -326,96 +475,43 @@ def render_demo_mode():
     st.markdown("Select a scenario to load a pre-configured dataset and see Aegis AI in action.")
     st.divider()
 
-    scenarios = {
-        "university_exam_stress": {
-            "label": "Load University Exam Stress Scenario",
-            "sdg": "**SDG Alignment:** SDG 3 (Good Health & Well-being), SDG 4 (Quality Education) — "
-                   "Aegis AI helps institutions detect early signs of student mental health crises during "
-                   "high-pressure academic periods, enabling timely intervention and support.",
-            "pitch": (
-                "Imagine it's finals week at a major university. Counseling centers are overwhelmed, "
-                "online exam platforms are buckling, and rumors about schedule changes are spreading. "
-                "Aegis AI monitors these signals in real time — flagging critical stress indicators, "
-                "predicting service bottlenecks, and filtering misinformation. With Aegis AI, administrators "
-                "can act before a crisis escalates, not after. Every recommendation comes with full transparency "
-                "and a human-in-the-loop safeguard."
-            ),
-        },
-        "healthcare_capacity": {
-            "label": "Load Healthcare Capacity Scenario",
-            "sdg": "**SDG Alignment:** SDG 3 (Good Health & Well-being) — "
-                   "Aegis AI supports healthcare systems in managing capacity surges, protecting "
-                   "frontline worker wellness, and maintaining care quality under pressure.",
-            "pitch": (
-                "A regional hospital network is facing a surge in emergency admissions. ICU beds are running low, "
-                "staff burnout is spiking, and fraudulent billing claims are mixed into the chaos. "
-                "Aegis AI provides a unified risk dashboard — surfacing the most critical capacity signals, "
-                "flagging anomalies in real time, and recommending concrete interventions. The system never acts "
-                "alone: every alert includes a confidence score and requires human approval. This is AI that "
-                "supports healthcare professionals, not replaces them."
-            ),
-        },
-        "financial_fraud": {
-            "label": "Load Financial Fraud Scenario",
-            "sdg": "**SDG Alignment:** SDG 16 (Peace, Justice & Strong Institutions) — "
-                   "Aegis AI strengthens financial integrity by detecting fraud patterns, protecting "
-                   "consumers, and supporting regulatory compliance.",
-            "pitch": (
-                "A financial institution is seeing unusual patterns: synthetic identities in new accounts, "
-                "micro-transaction probing, and phishing campaigns targeting customers. Traditional rule-based "
-                "systems are overwhelmed by the volume. Aegis AI uses multi-signal analysis to detect, classify, "
-                "and prioritize fraud risks — from critical account freezes to routine monitoring. Every decision "
-                "is auditable, every recommendation transparent. This is responsible AI for the enterprise."
-            ),
-        },
-    }
-
-    for scenario_key, config in scenarios.items():
+    for scenario_key, config in _SCENARIOS.items():
         if st.button(config["label"], key=f"demo_{scenario_key}"):
             st.session_state["demo_scenario"] = scenario_key
 
     if "demo_scenario" in st.session_state:
         scenario_key = st.session_state["demo_scenario"]
-        config = scenarios[scenario_key]
+        config = _SCENARIOS[scenario_key]
 
-        df = generate_simulated_signals(30, scenario_key)
-        enriched = enrich_dataframe(df)
-        enriched = enriched.sort_values("severity_score", ascending=False).reset_index(drop=True)
+        enriched, top_alerts, anomalies = _load_scenario(scenario_key)
 
         scenario_name = config["label"].replace("Load ", "").replace(" Scenario", "")
 
-        top_alerts = enriched.nlargest(3, "severity_score")
         top_categories = enriched["category"].value_counts().head(2)
 
         st.divider()
         st.subheader("Scenario Summary")
         st.markdown(f"**Scenario Loaded:** {scenario_name}")
 
-        top_cat_str = ", ".join([f"{cat.replace('_', ' ').title()} ({cnt})" for cat, cnt in top_categories.items()])
-        critical_count = len(enriched[enriched["risk_level"] == "Critical"])
-        high_count = len(enriched[enriched["risk_level"] == "High"])
-        anomaly_count = len(enriched[enriched["anomaly_flag"]])
-
-        top_cat_names = [cat.replace("_", " ").title() for cat in top_categories.index]
-        domains_str = " and ".join(top_cat_names[:2]) if len(top_cat_names) >= 2 else top_cat_names[0]
+        top_cats = top_categories.rename_axis("cat").reset_index(name="cnt")
+        top_cats["cat"] = top_cats["cat"].astype(str).str.replace("_", " ").str.title()
+        top_cat_str = (top_cats["cat"] + " (" + top_cats["cnt"].astype(str) + ")").str.cat(sep=", ")
+        risk_counts = enriched["risk_level"].value_counts().reindex(_RISK_LEVELS_DESC, fill_value=0)
+        critical_count = risk_counts["Critical"]
+        high_count = risk_counts["High"]
+        anomaly_count = len(anomalies)
+
+        domains_str = top_cats["cat"].str.cat(sep=" and ")
+
+        summary_tmpl = _EXEC_SUMMARY_CRITICAL_TMPL if critical_count > 0 else _EXEC_SUMMARY_ELEVATED_TMPL
+        st.info(summary_tmpl.format_map({
+            "domains": domains_str,
+            "critical": critical_count,
+            "high": high_count,
+            "anomalies": anomaly_count,
+        }))
+        st.markdown(_PRIMARY_CATEGORIES_TMPL.format_map({"categories": top_cat_str}))
 
-        if critical_count > 0:
-            summary_text = (
-                f"**Executive Summary:** Escalation thresholds were breached across {domains_str} domains. "
-                f"{critical_count} critical and {high_count} high-severity signals require leadership attention. "
-                f"{anomaly_count} anomalous patterns identified. "
-                f"Coordinated intervention within 60 minutes is recommended."
-            )
-        else:
-            summary_text = (
-                f"**Executive Summary:** Elevated risk activity detected across {domains_str} domains. "
-                f"{high_count} high-severity signals and {anomaly_count} anomalies warrant close monitoring. "
-                f"Recommend proactive resource allocation and stakeholder notification."
-            )
-        st.info(summary_text)
-        st.markdown(f"**Primary Categories:** {top_cat_str}")
-
-        risk_counts = enriched["risk_level"].value_counts().reindex(["Critical", "High", "Medium", "Low"], fill_value=0)
         chart_df = pd.DataFrame({"Risk Level": risk_counts.index, "Count": risk_counts.values})
         chart_df = chart_df.set_index("Risk Level")
         st.bar_chart(chart_df)
@@ -423,50 +519,47 @@ def render_demo_mode():
         st.divider()
         st.subheader("Top Critical Alerts (Immediate Action Required)")
 
-        for _, row in top_alerts.iterrows():
-            risk_level = row["risk_level"]
-            impact = estimate_enterprise_impact(risk_level)
-            owner = get_owner_team(row["category"])
-            sla = get_sla(risk_level)
-
+        top_anomaly = top_alerts["anomaly_flag"].to_numpy(dtype=bool)
+        alert_cards = top_alerts.assign(
+            cat_title=top_alerts["category"].astype(str).str.replace("_", " ").str.title(),
+            anomaly_text=np.where(top_anomaly, "Yes", "No"),
+        )
+        for cat_title, severity, risk_level, confidence, anomaly_text, impact, owner, sla, description in (
+            alert_cards[_ALERT_CARD_COLS].itertuples(index=False, name=None)
+        ):
             with st.container():
                 st.error(
-                    f"**{row['category'].replace('_', ' ').title()}** — "
-                    f"Severity: {row['severity_score']:.2f} | "
+                    f"**{cat_title}** — "
+                    f"Severity: {severity:.2f} | "
                     f"Risk: {risk_level} | "
-                    f"Confidence: {row['confidence_score']:.2f}\n\n"
-                    f"Anomaly Detected: {'Yes' if row['anomaly_flag'] else 'No'} | "
+                    f"Confidence: {confidence:.2f}\n\n"
+                    f"Anomaly Detected: {anomaly_text} | "
                     f"Enterprise Impact Level: {impact} | "
                     f"Recommended Owner: {owner} | "
                     f"SLA: {sla}\n\n"
-                    f"{row['description']}"
+                    f"{description}"
                 )
                 st.caption("Final action requires human authorization.")
 
         st.divider()
         st.subheader("Recommended Actions Queue")
-        actions_data = []
-        for _, row in top_alerts.iterrows():
-            risk_level = row["risk_level"]
-            owner = get_owner_team(row["category"])
-            sla = get_sla(risk_level)
-            intervention = recommend_intervention(row["category"], risk_level, row["anomaly_flag"])
-            actions_data.append({
-                "Action": intervention[:120] + "..." if len(intervention) > 120 else intervention,
-                "Owner": owner,
-                "SLA": sla,
-                "Status": "Pending",
-            })
-        st.table(pd.DataFrame(actions_data))
+        interventions = pd.Series(recommend_intervention_vec(
+            pd.Categorical(top_alerts["category"], categories=CATEGORIES).codes,
+            top_alerts["risk_level"].cat.codes.to_numpy(),
+            top_anomaly,
+        ))
+        actions_df = pd.DataFrame({
+            "Action": interventions.where(interventions.str.len() <= 120, interventions.str[:120] + "..."),
+            "Owner": top_alerts["owner_team"].to_numpy(),
+            "SLA": top_alerts["sla"].to_numpy(),
+            "Status": "Pending",
+        })
+        st.table(actions_df)
 
         st.divider()
-        anomalies = enriched[enriched["anomaly_flag"]]
-        st.subheader(f"Anomalies Detected: {len(anomalies)}")
-        if len(anomalies) > 0:
-            st.dataframe(
-                anomalies[["timestamp", "category", "severity_score", "risk_level", "confidence_score", "description"]],
-                use_container_width=True,
-            )
+        st.subheader(f"Anomalies Detected: {anomaly_count}")
+        if anomaly_count > 0:
+            st.dataframe(anomalies, use_container_width=True)
         else:
             st.success("No anomalies detected in this scenario.")
 
@@ -484,8 +577,22 @@ def render_demo_mode():
         )
 
         st.divider()
-        st.markdown("#### Full Enriched Dataset")
-        st.dataframe(enriched, use_container_width=True)
+        with st.expander("Full Enriched Dataset"):
+            page = st.number_input(
+                "Page",
+                min_value=0,
+                max_value=max((len(enriched) - 1) // _PAGE_SIZE, 0),
+                value=0,
+                step=1,
+                key=f"page_{scenario_key}",
+            )
+            st.dataframe(enriched.iloc[page * _PAGE_SIZE:(page + 1) * _PAGE_SIZE], use_container_width=True)
+            st.download_button(
+                "Download CSV",
+                _scenario_csv(scenario_key),
+                file_name=f"{scenario_key}_enriched.csv",
+                mime="text/csv",
+            )
 
 
 def render_footer():